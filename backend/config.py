@@ -1,36 +1,92 @@
 """Configuration for MetaReasoner."""
 
+import functools
 import os
-from dotenv import load_dotenv
+import sys
+from pathlib import Path
+
+# Path to the project-level .env file
+ENV_PATH = Path(__file__).parent.parent / ".env"
+
+
+# --- CHANGED --- Parse .env once into an in-memory cache instead of load_dotenv
+@functools.lru_cache(maxsize=1)
+def _load_env_file() -> dict:
+    """Parse the .env file once and cache the result in memory."""
+    env = {}
+    if ENV_PATH.exists():
+        with open(ENV_PATH, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                env[key.strip()] = value.strip().strip('"\'')
+    return env
+
+
+def get_env(key: str, default: str = None) -> str:
+    """Look up a key in os.environ, falling back to the cached .env contents.
+
+    Real environment variables win over the .env file, matching load_dotenv's
+    no-override behaviour.
+    """
+    value = os.environ.get(key)
+    if value is None:
+        value = _load_env_file().get(key, default)
+    return value
+
+
+def reload_env():
+    """Invalidate the cached .env contents (called after settings updates)."""
+    _load_env_file.cache_clear()
 
-load_dotenv()
 
 # OpenRouter API key
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+OPENROUTER_API_KEY = get_env("OPENROUTER_API_KEY")
+
+# --- CHANGED --- Optional key pool (OPENROUTER_API_KEYS=key1,key2,...) to
+# spread load across per-key rate limits; falls back to the single key
+OPENROUTER_API_KEYS = [
+    k.strip()
+    for k in (get_env("OPENROUTER_API_KEYS", "") or "").split(",")
+    if k.strip()
+]
+if not OPENROUTER_API_KEYS and OPENROUTER_API_KEY:
+    OPENROUTER_API_KEYS = [OPENROUTER_API_KEY]
 
-# Council members - list of OpenRouter model identifiers
-COUNCIL_MODELS = [
+# Council members - tuple of OpenRouter model identifiers
+# --- CHANGED --- Immutable tuples with interned model names: presets are
+# shared read-only, and models appearing in several presets share one string
+COUNCIL_MODELS = tuple(sys.intern(m) for m in (
     "openai/gpt-5.1",
     "google/gemini-3-pro-preview",
     "anthropic/claude-sonnet-4.5",
     "x-ai/grok-4",
-]
+))
 
 # --- CHANGED --- Added Router Model and Council Presets
 ROUTER_MODEL = "google/gemini-2.5-flash"
 
 COUNCIL_PRESETS = {
-    "CODING": ["deepseek/deepseek-coder", "anthropic/claude-3.5-sonnet", "openai/gpt-4o"],
-    "MATH": ["openai/o1-mini", "google/gemini-1.5-pro", "anthropic/claude-3.5-sonnet"],
-    "CREATIVE_WRITING": ["anthropic/claude-3-opus", "google/gemini-2.5-flash", "mistralai/mixtral-8x7b-instruct"],
-    "FACTUAL_RESEARCH": ["perplexity/llama-3.1-sonar-large-128k-online", "openai/gpt-4o", "x-ai/grok-2"],
-    "REASONING": ["openai/o1", "anthropic/claude-3.5-sonnet", "google/gemini-1.5-pro"],
-    "GENERAL": COUNCIL_MODELS
+    category: tuple(sys.intern(m) for m in models)
+    for category, models in {
+        "CODING": ("deepseek/deepseek-coder", "anthropic/claude-3.5-sonnet", "openai/gpt-4o"),
+        "MATH": ("openai/o1-mini", "google/gemini-1.5-pro", "anthropic/claude-3.5-sonnet"),
+        "CREATIVE_WRITING": ("anthropic/claude-3-opus", "google/gemini-2.5-flash", "mistralai/mixtral-8x7b-instruct"),
+        "FACTUAL_RESEARCH": ("perplexity/llama-3.1-sonar-large-128k-online", "openai/gpt-4o", "x-ai/grok-2"),
+        "REASONING": ("openai/o1", "anthropic/claude-3.5-sonnet", "google/gemini-1.5-pro"),
+        "GENERAL": COUNCIL_MODELS,
+    }.items()
 }
 
 # Chairman model - synthesizes final response
 CHAIRMAN_MODEL = "google/gemini-3-pro-preview"
 
+# --- CHANGED --- Opt-in speculative Stage 3: the chairman starts on Stage 1
+# output alone and is only restarted if Stage 2 lands before its first token
+SPECULATIVE_STAGE3 = (get_env("SPECULATIVE_STAGE3", "false") or "false").lower() == "true"
+
 # OpenRouter API endpoint
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
@@ -1,14 +1,51 @@
 """3-stage MetaReasoner orchestration."""
 
-import json
-from typing import List, Dict, Any, Tuple, AsyncGenerator
-from typing import List, Dict, Any, Tuple, AsyncGenerator
-from .openrouter import query_models_parallel, query_model, stream_model
-from .config import COUNCIL_MODELS, CHAIRMAN_MODEL, STAGE1_SYSTEM_PROMPT, STAGE2_SYSTEM_PROMPT, ROUTER_MODEL, COUNCIL_PRESETS
+import asyncio
+import io
+import re
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple, AsyncGenerator
+
+import numpy as np
+import orjson
+from async_lru import alru_cache
+from .openrouter import query_models_parallel, query_models_quorum, query_model, stream_model
+from .config import COUNCIL_MODELS, CHAIRMAN_MODEL, STAGE1_SYSTEM_PROMPT, STAGE2_SYSTEM_PROMPT, ROUTER_MODEL, COUNCIL_PRESETS, SPECULATIVE_STAGE3
+
+# --- CHANGED --- Compile the ranking-extraction patterns once at import time
+_NUMBERED_RE = re.compile(r'\d+\.\s*Response [A-Z]')
+_LABEL_RE = re.compile(r'Response [A-Z]')
+
+
+# --- CHANGED --- C-implemented removeprefix/removesuffix instead of
+# startswith/endswith checks plus manual slicing
+def _strip_md_fences(text: str) -> str:
+    """Strip surrounding markdown code fences from a model response."""
+    return text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+
+
+# --- CHANGED --- Slotted records instead of dicts for the fixed-shape stage
+# results: roughly half the memory per record and no hashing on field access.
+# orjson and FastAPI both serialize dataclasses natively, so the JSON shape at
+# the HTTP boundary is unchanged.
+@dataclass(slots=True)
+class Stage1Result:
+    """A single council member's Stage 1 response."""
+    model: str
+    response: str
+
+
+@dataclass(slots=True)
+class Stage2Result:
+    """A single evaluator's Stage 2 ranking of the anonymized responses."""
+    model: str
+    ranking: str
+    parsed_ranking: List[str] = field(default_factory=list)
+    rubric: Optional[List[Dict[str, Any]]] = None
 
 
 # --- CHANGED --- Added optional council_models list
-async def stage1_collect_responses(user_query: str, council_models: List[str] = None) -> List[Dict[str, Any]]:
+async def stage1_collect_responses(user_query: str, council_models: List[str] = None) -> List[Stage1Result]:
     """
     Stage 1: Collect individual responses from all council models.
 
@@ -16,7 +53,7 @@ async def stage1_collect_responses(user_query: str, council_models: List[str] =
         user_query: The user's question
 
     Returns:
-        List of dicts with 'model' and 'response' keys
+        List of Stage1Result records
     """
     # --- CHANGED --- Prepend system prompt
     messages = [
@@ -34,10 +71,10 @@ async def stage1_collect_responses(user_query: str, council_models: List[str] =
     stage1_results = []
     for model, response in responses.items():
         if response is not None:  # Only include successful responses
-            stage1_results.append({
-                "model": model,
-                "response": response.get('content', '')
-            })
+            stage1_results.append(Stage1Result(
+                model=model,
+                response=response.get('content', '')
+            ))
 
     return stage1_results
 
@@ -45,9 +82,9 @@ async def stage1_collect_responses(user_query: str, council_models: List[str] =
 # --- CHANGED --- Added optional council_models override block
 async def stage2_collect_rankings(
     user_query: str,
-    stage1_results: List[Dict[str, Any]],
+    stage1_results: List[Stage1Result],
     council_models: List[str] = None
-) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+) -> Tuple[List[Stage2Result], Dict[str, str]]:
     """
     Stage 2: Each model ranks the anonymized responses.
 
@@ -58,20 +95,23 @@ async def stage2_collect_rankings(
     Returns:
         Tuple of (rankings list, label_to_model mapping)
     """
-    # Create anonymized labels for responses (Response A, Response B, etc.)
-    labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
-
-    # Create mapping from label to model name
-    label_to_model = {
-        f"Response {label}": result['model']
-        for label, result in zip(labels, stage1_results)
-    }
-
-    # Build the ranking prompt
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
+    # Anonymized labels (Response A, Response B, ...), the label->model
+    # mapping, and the ranking prompt body all come from one pass over the
+    # results instead of three separate walks.
+    # --- CHANGED --- Fused label/mapping/prompt construction
+    # (buffered writes: responses can be tens of KB each, and f-string + join
+    # would copy every byte twice)
+    label_to_model = {}
+    buf = io.StringIO()
+    for i, result in enumerate(stage1_results):
+        label = f"Response {chr(65 + i)}"
+        label_to_model[label] = result.model
+        if i:
+            buf.write("\n\n")
+        buf.write(label)
+        buf.write(":\n")
+        buf.write(result.response)
+    responses_text = buf.getvalue()
 
     ranking_prompt = f"""You are evaluating different responses to the following question:
 
@@ -93,7 +133,10 @@ Now provide your evaluation:"""
     active_models = council_models if council_models is not None else COUNCIL_MODELS
 
     # Get rankings from all council models in parallel
-    responses = await query_models_parallel(active_models, messages)
+    # --- CHANGED --- Quorum gather: one slow evaluator no longer holds up the
+    # stage; its ranking is dropped after a grace period and the synthesis
+    # proceeds with the rankings that arrived.
+    responses = await query_models_quorum(active_models, messages)
 
     # Format results
     stage2_results = []
@@ -105,18 +148,10 @@ Now provide your evaluation:"""
             rubric = None
             parsed_ranking = []
             
-            clean_text = full_text.strip()
-            # Strip markdown fences
-            if clean_text.startswith("```json"):
-                clean_text = clean_text[7:]
-            elif clean_text.startswith("```"):
-                clean_text = clean_text[3:]
-            if clean_text.endswith("```"):
-                clean_text = clean_text[:-3]
-            clean_text = clean_text.strip()
-            
+            clean_text = _strip_md_fences(full_text)
+
             try:
-                data = json.loads(clean_text)
+                data = orjson.loads(clean_text)
                 if isinstance(data, dict) and "evaluations" in data:
                     rubric = data["evaluations"]
                     # Generate parsed_ranking from rubric (highest score to lowest)
@@ -132,12 +167,12 @@ Now provide your evaluation:"""
             if not parsed_ranking:
                 parsed_ranking = parse_ranking_from_text(full_text)
 
-            stage2_results.append({
-                "model": model,
-                "ranking": full_text,
-                "parsed_ranking": parsed_ranking,
-                "rubric": rubric
-            })
+            stage2_results.append(Stage2Result(
+                model=model,
+                ranking=full_text,
+                parsed_ranking=parsed_ranking,
+                rubric=rubric
+            ))
 
     return stage2_results, label_to_model
 
@@ -145,8 +180,8 @@ Now provide your evaluation:"""
 # --- CHANGED --- Converted to async generator for streaming
 async def stage3_synthesize_final(
     user_query: str,
-    stage1_results: List[Dict[str, Any]],
-    stage2_results: List[Dict[str, Any]],
+    stage1_results: List[Stage1Result],
+    stage2_results: List[Stage2Result],
     critical_issues: List[Dict[str, Any]] = None
 ) -> AsyncGenerator[Any, None]:
     """
@@ -161,15 +196,26 @@ async def stage3_synthesize_final(
         String tokens as they stream in, and finally a dict with the full response
     """
     # Build comprehensive context for chairman
-    stage1_text = "\n\n".join([
-        f"Model: {result['model']}\nResponse: {result['response']}"
-        for result in stage1_results
-    ])
-
-    stage2_text = "\n\n".join([
-        f"Model: {result['model']}\nRanking: {result['ranking']}"
-        for result in stage2_results
-    ])
+    # --- CHANGED --- Buffered writes instead of f-string + join copies
+    buf = io.StringIO()
+    for i, result in enumerate(stage1_results):
+        if i:
+            buf.write("\n\n")
+        buf.write("Model: ")
+        buf.write(result.model)
+        buf.write("\nResponse: ")
+        buf.write(result.response)
+    stage1_text = buf.getvalue()
+
+    buf = io.StringIO()
+    for i, result in enumerate(stage2_results):
+        if i:
+            buf.write("\n\n")
+        buf.write("Model: ")
+        buf.write(result.model)
+        buf.write("\nRanking: ")
+        buf.write(result.ranking)
+    stage2_text = buf.getvalue()
 
     chairman_prompt = f"""You are the Chairman of MetaReasoner. Multiple AI models have provided responses to a user's question, and then ranked each other's responses.
 
@@ -198,16 +244,18 @@ Provide a clear, well-reasoned final answer that represents the council's collec
     messages = [{"role": "user", "content": chairman_prompt}]
 
     # Query the chairman model with streaming
-    accumulated_text = ""
+    # --- CHANGED --- Buffer tokens in a list and join once: += on a string
+    # recopies the whole accumulated text on every token
+    chunks = []
     async for chunk in stream_model(CHAIRMAN_MODEL, messages):
-        accumulated_text += chunk
+        chunks.append(chunk)
         yield chunk
 
     # Yield the final sentinel dictionary
     yield {
         "model": CHAIRMAN_MODEL,
         "done": True,
-        "response": accumulated_text
+        "response": "".join(chunks)
     }
 
 
@@ -237,19 +285,10 @@ Return ONLY a JSON object with this exact schema:
 
     for model, response in responses.items():
         if response is not None:
-            full_text = response.get('content', '').strip()
-            
-            clean_text = full_text
-            if clean_text.startswith("```json"):
-                clean_text = clean_text[7:]
-            elif clean_text.startswith("```"):
-                clean_text = clean_text[3:]
-            if clean_text.endswith("```"):
-                clean_text = clean_text[:-3]
-            clean_text = clean_text.strip()
-            
+            clean_text = _strip_md_fences(response.get('content', ''))
+
             try:
-                data = json.loads(clean_text)
+                data = orjson.loads(clean_text)
                 if isinstance(data, dict) and "issues" in data:
                     issues = data["issues"]
                     for issue in issues:
@@ -277,27 +316,23 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
     Returns:
         List of response labels in ranked order
     """
-    import re
-
-    # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
-        # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[-1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
-            if numbered_matches:
-                # Extract just the "Response X" part
-                return [re.search(r'Response [A-Z]', m).group() for m in numbered_matches]
+    # Look for the last "FINAL RANKING:" section in a single reverse scan
+    idx = ranking_text.rfind("FINAL RANKING:")
+    if idx != -1:
+        ranking_section = ranking_text[idx + len("FINAL RANKING:"):]
+        # Try to extract numbered list format (e.g., "1. Response A")
+        # This pattern looks for: number, period, optional space, "Response X"
+        numbered_matches = _NUMBERED_RE.findall(ranking_section)
+        if numbered_matches:
+            # Extract just the "Response X" part
+            return [_LABEL_RE.search(m).group() for m in numbered_matches]
 
     # Return empty list if no valid ranking section is found
     return []
 
 
 def calculate_aggregate_rankings(
-    stage2_results: List[Dict[str, Any]],
+    stage2_results: List[Stage2Result],
     label_to_model: Dict[str, str]
 ) -> List[Dict[str, Any]]:
     """
@@ -310,58 +345,77 @@ def calculate_aggregate_rankings(
     Returns:
         List of dicts with model name and scores, sorted best to worst
     """
-    from collections import defaultdict
-
-    # Track total score for each model
-    model_scores = defaultdict(float)
-    model_counts = defaultdict(int)
-
     num_options = len(label_to_model)
 
+    # --- CHANGED --- Index-based accumulation: scores and counts live in
+    # arrays indexed by model id, so neither path hashes model-name strings
+    # on every update.
+    model_idx = {m: i for i, m in enumerate(dict.fromkeys(label_to_model.values()))}
+    totals = np.zeros(len(model_idx))
+    counts = np.zeros(len(model_idx), dtype=np.int64)
+
+    # --- CHANGED --- Vectorized rubric aggregation: gather all rubric entries
+    # into flat arrays, then score them with a handful of NumPy ops instead of
+    # per-entry Python float arithmetic.
+    score_rows = []     # (accuracy, reasoning, completeness, clarity) per entry
+    conf_rows = []      # confidence per entry
+    subject_rows = []   # subject model index per entry
+    self_rows = []      # True where evaluator scored itself
+
     for ranking in stage2_results:
-        evaluator_model = ranking['model']
-        rubric = ranking.get('rubric')
+        evaluator_model = ranking.model
+        rubric = ranking.rubric
 
         if rubric:
             for ev in rubric:
                 label = f"Response {ev.get('response_label', '')}"
                 if label in label_to_model:
                     subject_model = label_to_model[label]
-                    
-                    accuracy = float(ev.get('accuracy', 0))
-                    reasoning = float(ev.get('reasoning', 0))
-                    completeness = float(ev.get('completeness', 0))
-                    clarity = float(ev.get('clarity', 0))
-                    confidence = float(ev.get('confidence', 1.0))
-                    
-                    raw_score = (accuracy + reasoning + completeness + clarity) * confidence
-                    weight = 0.5 if evaluator_model == subject_model else 1.0
-                    weighted_score = raw_score * weight
-                    
-                    model_scores[subject_model] += weighted_score
-                    model_counts[subject_model] += 1
+                    score_rows.append((
+                        ev.get('accuracy', 0),
+                        ev.get('reasoning', 0),
+                        ev.get('completeness', 0),
+                        ev.get('clarity', 0),
+                    ))
+                    conf_rows.append(ev.get('confidence', 1.0))
+                    subject_rows.append(model_idx[subject_model])
+                    self_rows.append(evaluator_model == subject_model)
         else:
             # Fallback to regex parsing/parsed_ranking
-            parsed_ranking = ranking.get('parsed_ranking', [])
+            parsed_ranking = ranking.parsed_ranking
             if not parsed_ranking:
-                parsed_ranking = parse_ranking_from_text(ranking.get('ranking', ''))
+                parsed_ranking = parse_ranking_from_text(ranking.ranking)
 
             for position, label in enumerate(parsed_ranking, start=1):
                 if label in label_to_model:
-                    subject_model = label_to_model[label]
-                    weight = 0.5 if evaluator_model == subject_model else 1.0
+                    idx = model_idx[label_to_model[label]]
+                    weight = 0.5 if evaluator_model == label_to_model[label] else 1.0
                     # Fallback scoring: 10 * (max_rank - position + 1)
                     mock_score = float((num_options - position + 1) * 10)
-                    model_scores[subject_model] += mock_score * weight
-                    model_counts[subject_model] += 1
+                    totals[idx] += mock_score * weight
+                    counts[idx] += 1
+
+    # --- CHANGED --- One shot of C-level math for all rubric entries
+    if score_rows:
+        scores = np.asarray(score_rows, dtype=np.float64)
+        conf = np.asarray(conf_rows, dtype=np.float64)
+        subject_idx = np.asarray(subject_rows)
+        weights = np.where(np.asarray(self_rows), 0.5, 1.0)
+
+        weighted = scores.sum(axis=1) * conf * weights
+        np.add.at(totals, subject_idx, weighted)
+        np.add.at(counts, subject_idx, 1)
 
     aggregate = []
-    for model, total_score in model_scores.items():
+    for model, i in model_idx.items():
+        if not counts[i]:
+            continue
+        total_score = round(float(totals[i]), 2)
         aggregate.append({
             "model": model,
-            "total_score": round(total_score, 2),
-            "average_rank": round(total_score, 2),  # Keep average_rank key to avoid breaking UI that expects it
-            "rankings_count": model_counts[model]
+            "total_score": total_score,
+            "average_rank": total_score,  # Keep average_rank key to avoid breaking UI that expects it
+            "rankings_count": int(counts[i])
         })
 
     # Sort by total_score descending
@@ -370,6 +424,8 @@ def calculate_aggregate_rankings(
     return aggregate
 
 
+# --- CHANGED --- Memoized: duplicate prompts reuse the generated title
+@alru_cache(maxsize=512)
 async def generate_conversation_title(user_query: str) -> str:
     """
     Generate a short title for a conversation based on the first user message.
@@ -408,9 +464,89 @@ Title:"""
     return title
 
 
+# --- CHANGED --- Marshal routing and title generation into one router call
+# (memoized: repeated first messages skip the router entirely)
+@alru_cache(maxsize=512)
+async def classify_and_title(user_query: str) -> Tuple[str, str]:
+    """
+    Classify a query and generate a conversation title in a single router call.
+
+    First messages need both, and both depend only on the query text, so
+    marshaling them into one request saves a full router round-trip.
+
+    Args:
+        user_query: The first user message
+
+    Returns:
+        Tuple of (category, title)
+    """
+    prompt = f"""Analyze the following user query.
+
+1. Classify it into EXACTLY ONE of the following categories:
+CODING
+MATH
+CREATIVE_WRITING
+FACTUAL_RESEARCH
+REASONING
+GENERAL
+
+2. Generate a very short title (3-5 words maximum) that summarizes it.
+The title should be concise and descriptive. Do not use quotes or punctuation in the title.
+
+Query: {user_query}
+
+Return ONLY a JSON object with this exact schema: {{"category": "...", "title": "..."}}"""
+
+    messages = [{"role": "user", "content": prompt}]
+
+    response = await query_model(ROUTER_MODEL, messages, timeout=30.0)
+
+    category = "GENERAL"
+    title = "New Conversation"
+    if response:
+        clean_text = _strip_md_fences(response.get('content', ''))
+
+        try:
+            data = orjson.loads(clean_text)
+        except Exception:
+            data = None
+
+        if isinstance(data, dict):
+            cat = str(data.get("category", "")).strip().upper()
+            if cat in COUNCIL_PRESETS:
+                category = cat
+            raw_title = str(data.get("title", "")).strip().strip('"\'')
+            if raw_title:
+                title = raw_title[:47] + "..." if len(raw_title) > 50 else raw_title
+
+    return category, title
+
+
+# --- CHANGED --- Keyword heuristics that classify obvious queries without
+# paying the router round-trip. A rule only fires on two or more hits, so a
+# passing mention of "import" or "prove" still falls through to the LLM.
+_KEYWORD_RULES = [
+    (re.compile(r'```|\b(def|import|class|function|compile|traceback|stack trace)\b'), "CODING"),
+    (re.compile(r'[∫∑√]|\b(prove|theorem|lemma|integral|derivative|equation|polynomial)\b'), "MATH"),
+    (re.compile(r'\b(poem|story|novel|lyrics|screenplay|haiku|fiction)\b'), "CREATIVE_WRITING"),
+]
+
+
 # --- CHANGED --- Added dynamic query classification
 async def classify_query(user_query: str) -> str:
-    """Classify user query to select the best council."""
+    """Classify user query to select the best council (cached on normalized text)."""
+    normalized = re.sub(r'\s+', ' ', user_query.strip().lower())[:512]
+    # --- CHANGED --- Fast path: high-confidence keyword matches skip the LLM
+    for pattern, category in _KEYWORD_RULES:
+        if len(pattern.findall(normalized)) >= 2:
+            return category
+    return await _classify_normalized(normalized)
+
+
+# --- CHANGED --- Memoize the router call so near-duplicate queries skip the LLM
+@alru_cache(maxsize=1024)
+async def _classify_normalized(user_query: str) -> str:
+    """Run the LLM router on a normalized query. Cached per normalized query."""
     prompt = f"""Analyze the following user query and classify it into EXACTLY ONE of the following categories:
 CODING
 MATH
@@ -447,24 +583,87 @@ async def get_council_for_query(user_query: str, user_override: List[str] = None
     return COUNCIL_PRESETS.get(category, COUNCIL_PRESETS["GENERAL"]), category
 
 
+# --- CHANGED --- Overlap router classification with a speculative Stage 1
+async def stage1_with_routing(
+    user_query: str,
+    user_override: List[str] = None,
+    category_task: "asyncio.Task" = None
+) -> Tuple[List[Stage1Result], List[str], str]:
+    """
+    Resolve the council and collect Stage 1 responses concurrently.
+
+    The router classification and a speculative Stage 1 against the default
+    council run in parallel, so the cheap router call no longer blocks the
+    expensive council calls. If the router picks a non-default preset, the
+    overlapping responses are reused and only the missing models are queried.
+
+    Args:
+        user_query: The user's question
+        user_override: Optional explicit council selection
+        category_task: Optional in-flight task resolving to the category,
+            awaited instead of issuing a fresh classify_query call
+
+    Returns:
+        Tuple of (stage1_results, resolved_models, detected_category)
+    """
+    if user_override and len(user_override) > 0:
+        resolved = list(user_override)
+        stage1_results = await stage1_collect_responses(user_query, resolved)
+        return stage1_results, resolved, "MANUAL_OVERRIDE"
+
+    # Speculative Stage 1 against the default council; shielded so it keeps
+    # running even if the caller is cancelled while awaiting the router.
+    speculative_task = asyncio.create_task(
+        stage1_collect_responses(user_query, COUNCIL_MODELS)
+    )
+    # --- CHANGED --- Reuse a marshaled classification when the caller has one
+    if category_task is not None:
+        category = await category_task
+    else:
+        category = await classify_query(user_query)
+    resolved = COUNCIL_PRESETS.get(category, COUNCIL_PRESETS["GENERAL"])
+
+    if resolved == COUNCIL_MODELS:
+        return await asyncio.shield(speculative_task), resolved, category
+
+    # Reuse overlapping speculative responses; query only the delta models.
+    # --- CHANGED --- The delta round starts the moment the category resolves
+    # so it runs concurrently with the still-in-flight speculative round
+    # instead of queueing behind it
+    missing = [m for m in resolved if m not in COUNCIL_MODELS]
+    delta_task = (
+        asyncio.create_task(stage1_collect_responses(user_query, missing))
+        if missing else None
+    )
+    speculative_results = await asyncio.shield(speculative_task)
+    reused = [r for r in speculative_results if r.model in resolved]
+    delta = await delta_task if delta_task is not None else []
+    return reused + delta, resolved, category
+
+
 # --- CHANGED --- Included council_models as parameter and hooked up dynamic routing
-async def run_full_council(user_query: str, council_models: List[str] = None) -> Tuple[List, List, Dict, Dict]:
+async def run_full_council(
+    user_query: str,
+    council_models: List[str] = None,
+    category_task: "asyncio.Task" = None
+) -> Tuple[List, List, Dict, Dict]:
     """
     Run the complete 3-stage council process.
 
     Args:
         user_query: The user's question
         council_models: Optional user override for council selection
+        category_task: Optional in-flight classification task (see
+            stage1_with_routing)
 
     Returns:
         Tuple of (stage1_results, stage2_results, stage3_result, metadata)
     """
-    # Resolve models dynamically
-    resolved_models, detected_category = await get_council_for_query(user_query, council_models)
-
-    # Stage 1: Collect individual responses
-    # --- CHANGED --- pass down user overrides
-    stage1_results = await stage1_collect_responses(user_query, resolved_models)
+    # Stage 1: Collect individual responses, with routing overlapped
+    # --- CHANGED --- classification and speculative Stage 1 run concurrently
+    stage1_results, resolved_models, detected_category = await stage1_with_routing(
+        user_query, council_models, category_task
+    )
 
     # --- CHANGED --- Validated that len() >= 2. A single response breaks Stage 2 parsing mathematically.
     if len(stage1_results) < 2:
@@ -473,24 +672,52 @@ async def run_full_council(user_query: str, council_models: List[str] = None) ->
             "response": "At least two models are required for consensus. Please try again."
         }, {"detected_category": detected_category}
 
-    # Stage 2: Collect rankings
-    # --- CHANGED --- pass down user overrides
-    stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results, resolved_models)
+    stage3_result = None
+    if SPECULATIVE_STAGE3:
+        # --- CHANGED --- Speculative Stage 3: fire the chairman on Stage 1
+        # output alone while Stage 2 runs. If the rankings land before the
+        # chairman's first token, restart it with the full context; otherwise
+        # accept the speculative synthesis and use Stage 2 only for metadata.
+        stage2_task = asyncio.create_task(
+            stage2_collect_rankings(user_query, stage1_results, resolved_models)
+        )
+        speculative_gen = stage3_synthesize_final(user_query, stage1_results, [])
+        first_chunk = await speculative_gen.__anext__()
+
+        if stage2_task.done():
+            await speculative_gen.aclose()
+            stage2_results, label_to_model = stage2_task.result()
+            async for chunk in stage3_synthesize_final(
+                user_query, stage1_results, stage2_results
+            ):
+                if isinstance(chunk, dict) and chunk.get("done"):
+                    stage3_result = chunk
+        else:
+            if isinstance(first_chunk, dict) and first_chunk.get("done"):
+                stage3_result = first_chunk
+            else:
+                async for chunk in speculative_gen:
+                    if isinstance(chunk, dict) and chunk.get("done"):
+                        stage3_result = chunk
+            stage2_results, label_to_model = await stage2_task
+    else:
+        # Stage 2: Collect rankings
+        # --- CHANGED --- pass down user overrides
+        stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results, resolved_models)
+
+        # Stage 3: Synthesize final answer
+        # --- CHANGED --- For non-streaming run_full_council, buffer the generator
+        async for chunk in stage3_synthesize_final(
+            user_query,
+            stage1_results,
+            stage2_results
+        ):
+            if isinstance(chunk, dict) and chunk.get("done"):
+                stage3_result = chunk
 
     # Calculate aggregate rankings
     aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
 
-    # Stage 3: Synthesize final answer
-    # --- CHANGED --- For non-streaming run_full_council, buffer the generator
-    stage3_result = None
-    async for chunk in stage3_synthesize_final(
-        user_query,
-        stage1_results,
-        stage2_results
-    ):
-        if isinstance(chunk, dict) and chunk.get("done"):
-            stage3_result = chunk
-
     # Prepare metadata
     metadata = {
         "label_to_model": label_to_model,
@@ -1,31 +1,60 @@
 """FastAPI backend for MetaReasoner."""
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any
 import uuid
-import json
 import asyncio
 import os
-from pathlib import Path
 
-from . import storage
+import orjson
+
+from . import openrouter, storage
 from .council import (
-    stage1_collect_responses,
     stage2_collect_rankings,
     calculate_aggregate_rankings,
     stage3_synthesize_final,
     stage4_validate_chairman,
-    generate_conversation_title,
+    classify_and_title,
     run_full_council,
-    get_council_for_query
+    stage1_with_routing
 )
-from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
+from .config import COUNCIL_MODELS, CHAIRMAN_MODEL, ENV_PATH, get_env, reload_env
 
 app = FastAPI(title="MetaReasoner API")
 
+
+# --- CHANGED --- orjson-backed serializer for the hot SSE path
+def _sse_json(payload: Any) -> str:
+    """Serialize an SSE event payload with orjson."""
+    return orjson.dumps(payload).decode()
+
+
+# --- CHANGED --- Compact framing for Stage 3 tokens: a 'T' marker instead of
+# a JSON envelope, so the per-token loop does no dict building or encoding
+TOKEN_PREFIX = b"data: T"
+
+# --- CHANGED --- Constant control frames, serialized once at import time
+STAGE1_START_EVT = b'data: {"type":"stage1_start"}\n\n'
+STAGE2_START_EVT = b'data: {"type":"stage2_start"}\n\n'
+STAGE3_START_EVT = b'data: {"type":"stage3_start"}\n\n'
+STAGE4_START_EVT = b'data: {"type":"stage4_start"}\n\n'
+COMPLETE_EVT = b'data: {"type":"complete"}\n\n'
+
+
+def _sse_token(chunk: str) -> bytes:
+    """Frame a Stage 3 token as a raw SSE data line (newlines escaped)."""
+    payload = chunk.encode().replace(b"\\", b"\\\\").replace(b"\n", b"\\n")
+    return TOKEN_PREFIX + payload + b"\n\n"
+
+
+# --- CHANGED --- Helper for sharing one marshaled router call between consumers
+async def _task_item(task: "asyncio.Task", index: int):
+    """Await a shared task and return one element of its result tuple."""
+    return (await task)[index]
+
 # Enable CORS for local development
 app.add_middleware(
     CORSMiddleware,
@@ -70,6 +99,13 @@ class Conversation(BaseModel):
     messages: List[Dict[str, Any]]
 
 
+# --- CHANGED --- Close the shared OpenRouter client with the app
+@app.on_event("shutdown")
+async def shutdown_openrouter_client():
+    """Release the pooled HTTP connections on shutdown."""
+    await openrouter.close_client()
+
+
 @app.get("/health")
 async def health_check():
     """Simple health check endpoint."""
@@ -77,62 +113,56 @@ async def health_check():
 
 
 # --- CHANGED --- Added /api/models endpoint to fetch default council models
+# --- CHANGED --- Response payload is constant; serialize it once
+_MODELS_PAYLOAD = orjson.dumps({
+    "council_models": COUNCIL_MODELS,
+    "chairman_model": CHAIRMAN_MODEL
+})
+
+
 @app.get("/api/models")
 async def get_models():
     """Get available models for the council."""
-    return {
-        "council_models": COUNCIL_MODELS,
-        "chairman_model": CHAIRMAN_MODEL
-    }
+    return Response(content=_MODELS_PAYLOAD, media_type="application/json")
 
 
 @app.get("/api/settings")
 async def get_settings():
-    """Get current settings from .env."""
-    env_path = Path(__file__).parent.parent / ".env"
-    api_key = ""
-    
-    if env_path.exists():
-        with open(env_path, "r") as f:
-            for line in f:
-                if line.startswith("OPENROUTER_API_KEY="):
-                    api_key = line.split("=", 1)[1].strip().strip('"\'')
-                    break
-                    
-    return {"openrouter_api_key": api_key}
+    """Get current settings from the cached .env contents."""
+    # --- CHANGED --- Read from the in-memory cache instead of re-parsing .env
+    return {"openrouter_api_key": get_env("OPENROUTER_API_KEY", "") or ""}
 
 
 @app.post("/api/settings")
 async def update_settings(settings: Settings):
     """Update settings in .env."""
-    env_path = Path(__file__).parent.parent / ".env"
-    if not env_path.exists():
-        env_path.touch()
-        
     # Read existing or create new
     lines = []
     found_key = False
-    
-    with open(env_path, "r") as f:
-        lines = f.readlines()
-            
+
+    if ENV_PATH.exists():
+        with open(ENV_PATH, "r") as f:
+            lines = f.readlines()
+
     # Update the key
     for i, line in enumerate(lines):
         if line.startswith("OPENROUTER_API_KEY="):
             lines[i] = f'OPENROUTER_API_KEY="{settings.openrouter_api_key}"\n'
             found_key = True
             break
-            
+
     if not found_key:
         lines.append(f'OPENROUTER_API_KEY="{settings.openrouter_api_key}"\n')
-        
-    # Write back
-    with open(env_path, "w") as f:
-        f.writelines(lines)
-        
+
+    # Write back in a single call
+    with open(ENV_PATH, "w") as f:
+        f.write("".join(lines))
+
     # Also update environment variable so it takes effect instantly
     os.environ["OPENROUTER_API_KEY"] = settings.openrouter_api_key
-        
+    # --- CHANGED --- Invalidate the cached .env contents
+    reload_env()
+
     return {"status": "success"}
 
 
@@ -149,6 +179,7 @@ async def get_analytics():
     elo_ratings = storage.calculate_elo_ratings()
     
     # 2. Cost summary and 3. Total conversations direct via SQLite
+    # --- CHANGED --- Shared module-level connection; do not close it
     conn = storage.get_db_connection()
     c = conn.cursor()
     
@@ -163,7 +194,6 @@ async def get_analytics():
         GROUP BY model
     ''')
     cost_rows = c.fetchall()
-    conn.close()
 
     cost_summary = []
     for row in cost_rows:
@@ -203,29 +233,36 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     Send a message and run the 3-stage council process.
     Returns the complete response with all stages.
     """
-    # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
-    if conversation is None:
+    # --- CHANGED --- Cheap cached existence check instead of loading the
+    # whole conversation just to 404 and count messages
+    if not storage.conversation_exists(conversation_id):
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
-
     # Add user message
-    storage.add_user_message(conversation_id, request.content)
-
-    # If this is the first message, generate a title
+    # --- CHANGED --- The insert reports the prior message count, so one call
+    # both stores the message and tells us whether it is the first
+    is_first_message = storage.add_user_message(conversation_id, request.content) == 0
+
+    # --- CHANGED --- First messages need a category and a title; marshal both
+    # into a single router call and let the council overlap with it.
+    title_task = None
+    category_task = None
     if is_first_message:
-        title = await generate_conversation_title(request.content)
-        storage.update_conversation_title(conversation_id, title)
+        combined_task = asyncio.create_task(classify_and_title(request.content))
+        category_task = asyncio.create_task(_task_item(combined_task, 0))
+        title_task = asyncio.create_task(_task_item(combined_task, 1))
 
     # Run the 3-stage council process
     # --- CHANGED --- Pass council_models downward
     stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
         request.content,
-        request.council_models
+        request.council_models,
+        category_task
     )
 
+    if title_task:
+        storage.update_conversation_title(conversation_id, await title_task)
+
     # Add assistant message with all stages
     storage.add_assistant_message(
         conversation_id,
@@ -249,75 +286,77 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     Send a message and stream the 3-stage council process.
     Returns Server-Sent Events as each stage completes.
     """
-    # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
-    if conversation is None:
+    # --- CHANGED --- Cheap cached existence check instead of loading the
+    # whole conversation just to 404 and count messages
+    if not storage.conversation_exists(conversation_id):
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
-
     async def event_generator():
         try:
             # Add user message
-            storage.add_user_message(conversation_id, request.content)
+            # --- CHANGED --- The insert reports the prior message count, so one
+            # call both stores the message and tells us whether it is the first
+            is_first_message = storage.add_user_message(conversation_id, request.content) == 0
 
-            # Start title generation in parallel (don't await yet)
+            # --- CHANGED --- Marshal title generation and routing into a single
+            # router call on first messages (don't await yet)
             title_task = None
+            category_task = None
             if is_first_message:
-                title_task = asyncio.create_task(generate_conversation_title(request.content))
-
-            # --- CHANGED --- Resolve models dynamically
-            council_models, detected_category = await get_council_for_query(request.content, request.council_models)
-
-            # Stage 1: Collect responses
-            yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-            # --- CHANGED --- Pass council_models downward
-            stage1_results = await stage1_collect_responses(request.content, council_models)
-            yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
+                combined_task = asyncio.create_task(classify_and_title(request.content))
+                category_task = asyncio.create_task(_task_item(combined_task, 0))
+                title_task = asyncio.create_task(_task_item(combined_task, 1))
+
+            # Stage 1: Collect responses, with routing overlapped
+            yield STAGE1_START_EVT
+            # --- CHANGED --- classification and speculative Stage 1 run concurrently
+            stage1_results, council_models, detected_category = await stage1_with_routing(
+                request.content, request.council_models, category_task
+            )
+            yield f"data: {_sse_json({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
 
             # Stage 2: Collect rankings
-            yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
+            yield STAGE2_START_EVT
             # --- CHANGED --- Pass council_models downward
             stage2_results, label_to_model = await stage2_collect_rankings(request.content, stage1_results, council_models)
             aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-            yield f"data: {json.dumps({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings, 'detected_category': detected_category}})}\n\n"
+            yield f"data: {_sse_json({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings, 'detected_category': detected_category}})}\n\n"
 
             # Stage 3: Synthesize final answer
-            yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
+            yield STAGE3_START_EVT
             # --- CHANGED --- Loop through generator yielding token events until Sentinel
             stage3_result = None
             async for chunk in stage3_synthesize_final(request.content, stage1_results, stage2_results):
                 if isinstance(chunk, dict) and chunk.get("done"):
                     stage3_result = {"model": chunk["model"], "response": chunk["response"]}
                 else:
-                    yield f"data: {json.dumps({'type': 'stage3_token', 'data': chunk})}\n\n"
-            yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
+                    yield _sse_token(chunk)
+            yield f"data: {_sse_json({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
 
             # Stage 4 Validation
-            yield f"data: {json.dumps({'type': 'stage4_start'})}\n\n"
+            yield STAGE4_START_EVT
             validation_result = await stage4_validate_chairman(stage3_result["response"], request.content, council_models)
-            yield f"data: {json.dumps({'type': 'stage4_complete', 'data': validation_result})}\n\n"
+            yield f"data: {_sse_json({'type': 'stage4_complete', 'data': validation_result})}\n\n"
 
             if validation_result.get("triggered"):
                 critical_issues = [iss for iss in validation_result.get("issues", []) if iss.get("severity") == "critical"]
                 
                 # Re-run Stage 3 Synthesis with formatting fixes
-                yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
+                yield STAGE3_START_EVT
                 stage3_result = None
                 async for chunk in stage3_synthesize_final(request.content, stage1_results, stage2_results, critical_issues=critical_issues):
                     if isinstance(chunk, dict) and chunk.get("done"):
                         stage3_result = {"model": chunk["model"], "response": chunk["response"]}
                     else:
-                        yield f"data: {json.dumps({'type': 'stage3_token', 'data': chunk})}\n\n"
+                        yield _sse_token(chunk)
                 
-                yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
+                yield f"data: {_sse_json({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
 
             # Wait for title generation if it was started
             if title_task:
                 title = await title_task
                 storage.update_conversation_title(conversation_id, title)
-                yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
+                yield f"data: {_sse_json({'type': 'title_complete', 'data': {'title': title}})}\n\n"
 
             # Save complete assistant message
             storage.add_assistant_message(
@@ -328,11 +367,11 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
             )
 
             # Send completion event
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            yield COMPLETE_EVT
 
         except Exception as e:
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield f"data: {_sse_json({'type': 'error', 'message': str(e)})}\n\n"
 
     return StreamingResponse(
         event_generator(),
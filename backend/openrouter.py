@@ -1,9 +1,78 @@
 """OpenRouter API client for making LLM requests."""
 
+import asyncio
+import time
+
 import httpx
 from typing import List, Dict, Any, Optional
 import json
-from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+from .config import OPENROUTER_API_KEY, OPENROUTER_API_KEYS, OPENROUTER_API_URL
+
+
+# --- CHANGED --- Round-robin key pool: N keys buy N x the per-key rate limit,
+# and keys that return 429 are evicted with exponential backoff
+class _KeyPool:
+    """Rotates across configured API keys, backing off rate-limited ones."""
+
+    def __init__(self, keys: List[str]):
+        self._keys = list(keys)
+        self._next = 0
+        self._banned_until = {}
+        self._backoff = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> Optional[str]:
+        """Return the next usable key, skipping temporarily banned ones."""
+        async with self._lock:
+            if not self._keys:
+                return OPENROUTER_API_KEY
+            now = time.monotonic()
+            for _ in range(len(self._keys)):
+                key = self._keys[self._next % len(self._keys)]
+                self._next += 1
+                if self._banned_until.get(key, 0.0) <= now:
+                    return key
+            # Every key is rate-limited; hand out the next one anyway
+            return self._keys[self._next % len(self._keys)]
+
+    async def report_rate_limited(self, key: str):
+        """Ban a key for an exponentially growing window after a 429."""
+        async with self._lock:
+            backoff = min(self._backoff.get(key, 1.0) * 2.0, 300.0)
+            self._backoff[key] = backoff
+            self._banned_until[key] = time.monotonic() + backoff
+
+    async def report_success(self, key: str):
+        """Reset a key's backoff after a successful call."""
+        async with self._lock:
+            self._backoff.pop(key, None)
+            self._banned_until.pop(key, None)
+
+
+_key_pool = _KeyPool(OPENROUTER_API_KEYS)
+
+
+# --- CHANGED --- One shared client for all calls: connection pooling plus
+# HTTP/2 multiplexing to the single OpenRouter host, instead of a fresh TLS
+# handshake per request
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it lazily."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(http2=True, timeout=120.0, limits=_LIMITS)
+    return _client
+
+
+async def close_client():
+    """Close the shared client (called on application shutdown)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
 
 
 async def query_model(
@@ -22,8 +91,10 @@ async def query_model(
     Returns:
         Response dict with 'content' and optional 'reasoning_details', or None if failed
     """
+    # --- CHANGED --- Rotate across the configured key pool
+    api_key = await _key_pool.acquire()
     headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
 
@@ -33,23 +104,27 @@ async def query_model(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
+        # --- CHANGED --- Reuse the shared pooled client
+        response = await get_client().post(
+            OPENROUTER_API_URL,
+            headers=headers,
+            json=payload,
+            timeout=timeout
+        )
+        if response.status_code == 429:
+            await _key_pool.report_rate_limited(api_key)
+        response.raise_for_status()
+        await _key_pool.report_success(api_key)
 
-            data = response.json()
-            message = data['choices'][0]['message']
-            usage = data.get('usage', {})
+        data = response.json()
+        message = data['choices'][0]['message']
+        usage = data.get('usage', {})
 
-            return {
-                'content': message.get('content'),
-                'reasoning_details': message.get('reasoning_details'),
-                'usage': usage
-            }
+        return {
+            'content': message.get('content'),
+            'reasoning_details': message.get('reasoning_details'),
+            'usage': usage
+        }
 
     except Exception as e:
         print(f"Error querying model {model}: {e}")
@@ -65,8 +140,10 @@ async def stream_model(
     """
     Stream a single model via OpenRouter API.
     """
+    # --- CHANGED --- Rotate across the configured key pool
+    api_key = await _key_pool.acquire()
     headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
 
@@ -77,35 +154,39 @@ async def stream_model(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream(
-                "POST",
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            ) as response:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
-                    line = line.strip()
-                    if not line:
+        # --- CHANGED --- Reuse the shared pooled client
+        async with get_client().stream(
+            "POST",
+            OPENROUTER_API_URL,
+            headers=headers,
+            json=payload,
+            timeout=timeout
+        ) as response:
+            if response.status_code == 429:
+                await _key_pool.report_rate_limited(api_key)
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                line = line.strip()
+                if not line:
+                    continue
+
+                if line == "data: [DONE]":
+                    break
+
+                if line.startswith("data: "):
+                    data_str = line[6:]
+                    try:
+                        data = json.loads(data_str)
+                        if "choices" in data and len(data["choices"]) > 0:
+                            delta = data["choices"][0].get("delta", {})
+                            content = delta.get("content", "")
+                            if content:
+                                yield content
+                    except json.JSONDecodeError:
                         continue
-                    
-                    if line == "data: [DONE]":
-                        break
-                        
-                    if line.startswith("data: "):
-                        data_str = line[6:]
-                        try:
-                            data = json.loads(data_str)
-                            if "choices" in data and len(data["choices"]) > 0:
-                                delta = data["choices"][0].get("delta", {})
-                                content = delta.get("content", "")
-                                if content:
-                                    yield content
-                        except json.JSONDecodeError:
-                            continue
-                            
+
+
     except Exception as e:
         print(f"Error streaming model {model}: {e}")
         yield f"\\n[Error streaming synthesis: {str(e)}]"
@@ -125,8 +206,6 @@ async def query_models_parallel(
     Returns:
         Dict mapping model identifier to response dict (or None if failed)
     """
-    import asyncio
-
     # Create tasks for all models
     tasks = [query_model(model, messages) for model in models]
 
@@ -135,3 +214,69 @@ async def query_models_parallel(
 
     # Map models to their responses
     return {model: response for model, response in zip(models, responses)}
+
+
+# --- CHANGED --- Quorum-based gather with straggler mitigation
+async def query_models_quorum(
+    models: List[str],
+    messages: List[Dict[str, str]],
+    grace_factor: float = 0.5,
+    min_grace: float = 5.0
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Query multiple models in parallel without waiting on stragglers forever.
+
+    Waits until every model answers, or until a quorum of max(2, N-1) has
+    answered and a grace period (grace_factor x the median response time so
+    far, floored at min_grace seconds) has elapsed. Models still pending
+    after the grace period are cancelled and mapped to None.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model
+        grace_factor: Fraction of the median response time granted to stragglers
+        min_grace: Lower bound on the grace period in seconds
+
+    Returns:
+        Dict mapping model identifier to response dict (or None if failed/dropped)
+    """
+    if not models:
+        return {}
+
+    start = time.monotonic()
+    tasks = {
+        asyncio.ensure_future(query_model(model, messages)): model
+        for model in models
+    }
+    quorum = max(2, len(tasks) - 1)
+
+    results = {}
+    durations = []
+    pending = set(tasks)
+    deadline = None
+
+    while pending:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        done, pending = await asyncio.wait(
+            pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        if not done:
+            # Grace period expired with stragglers still pending
+            break
+
+        now = time.monotonic()
+        for task in done:
+            durations.append(now - start)
+            results[tasks[task]] = task.result()
+
+        if deadline is None and len(results) >= quorum:
+            durations.sort()
+            median = durations[len(durations) // 2]
+            deadline = now + max(min_grace, grace_factor * median)
+
+    for task in pending:
+        task.cancel()
+        print(f"Dropping straggler response from {tasks[task]} after quorum grace period")
+        results[tasks[task]] = None
+
+    return results
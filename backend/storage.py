@@ -2,45 +2,123 @@
 
 import os
 import sqlite3
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
+from itertools import groupby
+
+import numpy as np
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from .council import Stage1Result, Stage2Result
+
 
 DB_DIR = "data"
 DB_PATH = os.path.join(DB_DIR, "metareasoner.db")
 
+# --- CHANGED --- Hot INSERT statements as module constants: a stable SQL
+# string is the key into sqlite3's per-connection statement cache, so each
+# shape is compiled once for the life of the process
+_SQL_INSERT_MESSAGE = (
+    "INSERT INTO messages (conversation_id, role, content, created_at) VALUES (?, ?, ?, ?)"
+)
+_SQL_INSERT_MESSAGE_NOTS = (
+    "INSERT INTO messages (conversation_id, role, content) VALUES (?, ?, ?)"
+)
+_SQL_BUMP_MESSAGE_COUNT = (
+    "UPDATE conversations SET message_count = message_count + 1 WHERE id = ?"
+)
+
+# --- CHANGED --- Response labels ("Response A" .. "Response Z") built once
+# instead of an f-string + chr() per model per message
+_LABELS = tuple(f"Response {chr(65 + i)}" for i in range(26))
+_SQL_INSERT_MR = (
+    "INSERT INTO model_responses (message_id, model, stage, response) VALUES (?, ?, ?, ?)"
+)
+_SQL_INSERT_RANK_FULL = '''
+    INSERT INTO rankings (
+        message_id, evaluator_model, subject_model, rank_position,
+        accuracy_score, reasoning_score, completeness_score, clarity_score, confidence
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 
 def ensure_data_dir():
     """Ensure the data directory exists."""
     Path(DB_DIR).mkdir(parents=True, exist_ok=True)
 
 
+# --- CHANGED --- One shared connection for the process instead of an
+# open/close pair per call: opening a SQLite connection re-warms the page
+# cache and re-prepares every statement. Writes are serialized by _WRITE_LOCK;
+# under WAL, reads never block on the writer.
+_CONN: Optional[sqlite3.Connection] = None
+_WRITE_LOCK = threading.Lock()
+
+
 def get_db_connection() -> sqlite3.Connection:
-    ensure_data_dir()
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    global _CONN
+    if _CONN is None:
+        ensure_data_dir()
+        # --- CHANGED --- Larger statement cache and autocommit mode: single
+        # statements commit on their own, and multi-statement writes open
+        # explicit BEGIN ... COMMIT blocks
+        conn = sqlite3.connect(
+            DB_PATH,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=None,
+        )
+        conn.row_factory = sqlite3.Row
+        # --- CHANGED --- Connection-scoped pragmas: NORMAL is safe under WAL and
+        # halves the fsyncs per commit; the rest keep hot pages and temp data in
+        # memory
+        c = conn.cursor()
+        c.execute("PRAGMA synchronous=NORMAL")
+        c.execute("PRAGMA temp_store=MEMORY")
+        c.execute("PRAGMA cache_size=-64000")
+        c.execute("PRAGMA mmap_size=268435456")
+        _CONN = conn
+    return _CONN
 
 
 def init_db():
     conn = get_db_connection()
     c = conn.cursor()
+    # --- CHANGED --- WAL is persistent per database file, so set it once here;
+    # writers no longer block readers and each commit costs one fsync
+    if DB_PATH != ":memory:":
+        c.execute("PRAGMA journal_mode=WAL")
+    # --- CHANGED --- created_at defaults are computed by SQLite, sparing a
+    # datetime.utcnow().isoformat() call and a parameter bind per insert
     c.execute('''
         CREATE TABLE IF NOT EXISTS conversations (
             id TEXT PRIMARY KEY,
             title TEXT,
-            created_at DATETIME,
-            query_type TEXT
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now')),
+            query_type TEXT,
+            message_count INTEGER NOT NULL DEFAULT 0
         )
     ''')
+    # --- CHANGED --- Migrate pre-existing databases: add the denormalized
+    # message counter and backfill it from the messages table
+    conv_columns = {row[1] for row in c.execute("PRAGMA table_info(conversations)")}
+    if "message_count" not in conv_columns:
+        c.execute("ALTER TABLE conversations ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0")
+        c.execute('''
+            UPDATE conversations SET message_count = (
+                SELECT COUNT(*) FROM messages WHERE messages.conversation_id = conversations.id
+            )
+        ''')
     c.execute('''
         CREATE TABLE IF NOT EXISTS messages (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             conversation_id TEXT,
             role TEXT,
             content TEXT,
-            created_at DATETIME
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
         )
     ''')
     c.execute('''
@@ -70,8 +148,26 @@ def init_db():
             confidence REAL
         )
     ''')
-    conn.commit()
-    conn.close()
+    # --- CHANGED --- Covering indexes for the hot lookups: stage responses
+    # and rankings by message, and messages by conversation. Without them
+    # every get_conversation and Elo pass scans the full tables.
+    c.execute('CREATE INDEX IF NOT EXISTS idx_mr_msg_stage ON model_responses(message_id, stage, id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_mr_stage_model ON model_responses(stage, model)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_rk_msg_eval ON rankings(message_id, evaluator_model, rank_position)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_msg_conv ON messages(conversation_id, created_at, id)')
+    c.execute('ANALYZE')
+
+    # --- CHANGED --- CREATE TABLE IF NOT EXISTS cannot retrofit the default
+    # onto a pre-existing database, and SQLite cannot ALTER a column default;
+    # legacy files keep receiving Python-side timestamps
+    global _DB_HAS_TS_DEFAULT
+    row = c.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'messages'"
+    ).fetchone()
+    _DB_HAS_TS_DEFAULT = row is not None and "DEFAULT" in row["sql"]
+
+
+_DB_HAS_TS_DEFAULT = False
 
 # Initialize DB on import
 init_db()
@@ -88,16 +184,25 @@ def create_conversation(conversation_id: str) -> Dict[str, Any]:
         New conversation dict
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    created_at = datetime.utcnow().isoformat()
-    
-    # Store minimal metadata
-    c.execute(
-        "INSERT INTO conversations (id, title, created_at, query_type) VALUES (?, ?, ?, ?)",
-        (conversation_id, "New Conversation", created_at, "GENERAL")
-    )
-    conn.commit()
-    conn.close()
+
+    # Store minimal metadata (single statement; autocommit)
+    with _WRITE_LOCK:
+        if _DB_HAS_TS_DEFAULT:
+            # Read the defaulted timestamp back with a PK lookup (RETURNING
+            # would be neater but needs SQLite >= 3.35)
+            conn.execute(
+                "INSERT INTO conversations (id, title, query_type) VALUES (?, ?, ?)",
+                (conversation_id, "New Conversation", "GENERAL")
+            )
+            created_at = conn.execute(
+                "SELECT created_at FROM conversations WHERE id = ?", (conversation_id,)
+            ).fetchone()["created_at"]
+        else:
+            created_at = datetime.utcnow().isoformat()
+            conn.execute(
+                "INSERT INTO conversations (id, title, created_at, query_type) VALUES (?, ?, ?, ?)",
+                (conversation_id, "New Conversation", created_at, "GENERAL")
+            )
 
     return {
         "id": conversation_id,
@@ -107,6 +212,45 @@ def create_conversation(conversation_id: str) -> Dict[str, Any]:
     }
 
 
+# --- CHANGED --- TTL cache for existence checks on the hot message path.
+# Only positive hits are cached; conversations are never deleted, so a cached
+# "exists" can't go stale.
+_EXISTS_CACHE = {}
+_EXISTS_TTL = 60.0
+_EXISTS_CACHE_MAX = 256
+
+
+def conversation_exists(conversation_id: str) -> bool:
+    """
+    Check whether a conversation exists without loading its messages.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        True if the conversation exists
+    """
+    now = time.monotonic()
+    expires = _EXISTS_CACHE.get(conversation_id)
+    if expires is not None and expires > now:
+        return True
+
+    conn = get_db_connection()
+    # --- CHANGED --- Connection-level execute: one shortcut call instead of
+    # materializing a cursor object first
+    row = conn.execute(
+        "SELECT 1 FROM conversations WHERE id = ? LIMIT 1", (conversation_id,)
+    ).fetchone()
+
+    if row is None:
+        return False
+
+    if len(_EXISTS_CACHE) >= _EXISTS_CACHE_MAX:
+        _EXISTS_CACHE.clear()
+    _EXISTS_CACHE[conversation_id] = now + _EXISTS_TTL
+    return True
+
+
 def list_conversations() -> List[Dict[str, Any]]:
     """
     List all conversations (metadata only).
@@ -115,16 +259,13 @@ def list_conversations() -> List[Dict[str, Any]]:
         List of conversation metadata dicts
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('''
-        SELECT c.id, c.created_at, c.title, COUNT(m.id) as message_count
-        FROM conversations c
-        LEFT JOIN messages m ON c.id = m.conversation_id
-        GROUP BY c.id
-        ORDER BY c.created_at DESC
-    ''')
-    rows = c.fetchall()
-    conn.close()
+    # --- CHANGED --- The denormalized counter replaces the LEFT JOIN +
+    # GROUP BY scan of messages
+    rows = conn.execute('''
+        SELECT id, created_at, title, message_count
+        FROM conversations
+        ORDER BY created_at DESC
+    ''').fetchall()
 
     conversations = []
     for row in rows:
@@ -154,7 +295,6 @@ def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
     c.execute("SELECT * FROM conversations WHERE id = ?", (conversation_id,))
     conv_row = c.fetchone()
     if not conv_row:
-        conn.close()
         return None
 
     conversation = {
@@ -167,6 +307,31 @@ def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
     c.execute("SELECT * FROM messages WHERE conversation_id = ? ORDER BY created_at ASC, id ASC", (conversation_id,))
     msg_rows = c.fetchall()
 
+    # --- CHANGED --- Bulk-load every assistant message's stage responses and
+    # rankings in two IN-clause queries instead of several executes per
+    # message, then group them in Python
+    assistant_ids = [m["id"] for m in msg_rows if m["role"] != "user"]
+    responses_by_msg = defaultdict(list)
+    rankings_by_eval = defaultdict(list)
+    if assistant_ids:
+        placeholders = ",".join("?" * len(assistant_ids))
+        c.execute(
+            f"SELECT message_id, model, stage, response FROM model_responses "
+            f"WHERE message_id IN ({placeholders}) ORDER BY message_id, stage, id",
+            assistant_ids
+        )
+        for r in c.fetchall():
+            responses_by_msg[r["message_id"]].append(r)
+        c.execute(
+            f"SELECT message_id, evaluator_model, subject_model, rank_position, "
+            f"accuracy_score, reasoning_score, completeness_score, clarity_score, confidence "
+            f"FROM rankings WHERE message_id IN ({placeholders}) "
+            f"ORDER BY message_id, evaluator_model, rank_position",
+            assistant_ids
+        )
+        for r in c.fetchall():
+            rankings_by_eval[(r["message_id"], r["evaluator_model"])].append(r)
+
     for msg in msg_rows:
         if msg["role"] == "user":
             conversation["messages"].append({
@@ -175,77 +340,65 @@ def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
             })
         else:
             msg_id = msg["id"]
+            stage_rows = responses_by_msg.get(msg_id, [])
 
-            # Load stage 1
-            c.execute("SELECT * FROM model_responses WHERE message_id = ? AND stage = 1 ORDER BY id ASC", (msg_id,))
-            s1_rows = c.fetchall()
-            stage1 = []
-            for r in s1_rows:
-                stage1.append({
-                    "model": r["model"],
-                    "response": r["response"]
-                })
+            # Stage 1 (rows arrive ordered by stage then id)
+            # --- CHANGED --- Build the result dicts in single comprehension
+            # expressions rather than append-per-row loops
+            stage1 = [
+                {"model": r["model"], "response": r["response"]}
+                for r in stage_rows if r["stage"] == 1
+            ]
 
             # Create reverse mapping for labels
-            model_to_label = {r["model"]: f"Response {chr(65+i)}" for i, r in enumerate(stage1)}
+            model_to_label = {r["model"]: _LABELS[i] for i, r in enumerate(stage1)}
 
-            # Load stage 2
-            c.execute("SELECT * FROM model_responses WHERE message_id = ? AND stage = 2 ORDER BY id ASC", (msg_id,))
-            s2_rows = c.fetchall()
+            # Stage 2
             stage2 = []
-            for r in s2_rows:
+            for r in (row for row in stage_rows if row["stage"] == 2):
                 evaluator_model = r["model"]
-                
-                c.execute(
-                    "SELECT * FROM rankings WHERE message_id = ? AND evaluator_model = ? ORDER BY rank_position ASC", 
-                    (msg_id, evaluator_model)
-                )
-                rank_rows = c.fetchall()
-
-                parsed_ranking = []
-                rubric = []
-                has_rubric = False
-
-                for rank in rank_rows:
-                    subject_model = rank["subject_model"]
-                    label = model_to_label.get(subject_model, subject_model)
-                    
-                    if rank["rank_position"] != 99:
-                        parsed_ranking.append(label)
-
-                    if rank["accuracy_score"] is not None:
-                        has_rubric = True
-                        rubric.append({
-                            "response_label": label.replace("Response ", ""),
-                            "accuracy": rank["accuracy_score"],
-                            "reasoning": rank["reasoning_score"],
-                            "completeness": rank["completeness_score"],
-                            "clarity": rank["clarity_score"],
-                            "confidence": rank["confidence"]
-                        })
+
+                rank_rows = rankings_by_eval.get((msg_id, evaluator_model), [])
+
+                parsed_ranking = [
+                    model_to_label.get(rank["subject_model"], rank["subject_model"])
+                    for rank in rank_rows if rank["rank_position"] != 99
+                ]
+                rubric = [
+                    {
+                        "response_label": model_to_label.get(
+                            rank["subject_model"], rank["subject_model"]
+                        ).replace("Response ", ""),
+                        "accuracy": rank["accuracy_score"],
+                        "reasoning": rank["reasoning_score"],
+                        "completeness": rank["completeness_score"],
+                        "clarity": rank["clarity_score"],
+                        "confidence": rank["confidence"]
+                    }
+                    for rank in rank_rows if rank["accuracy_score"] is not None
+                ]
 
                 s2_dict = {
                     "model": evaluator_model,
                     "ranking": r["response"]
                 }
-                
+
                 if parsed_ranking:
                     s2_dict["parsed_ranking"] = parsed_ranking
-                if has_rubric:
+                if rubric:
                     s2_dict["rubric"] = rubric
-                    
+
                 stage2.append(s2_dict)
 
-            # Load stage 3
-            c.execute("SELECT * FROM model_responses WHERE message_id = ? AND stage = 3", (msg_id,))
-            s3_row = c.fetchone()
-            if s3_row:
-                stage3 = {
-                    "model": s3_row["model"],
-                    "response": s3_row["response"]
-                }
-            else:
-                stage3 = None
+            # Stage 3
+            stage3 = None
+            for r in stage_rows:
+                if r["stage"] == 3:
+                    stage3 = {
+                        "model": r["model"],
+                        "response": r["response"]
+                    }
+                    break
 
             conversation["messages"].append({
                 "role": "assistant",
@@ -254,32 +407,56 @@ def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
                 "stage3": stage3
             })
 
-    conn.close()
     return conversation
 
 
-def add_user_message(conversation_id: str, content: str):
+def add_user_message(conversation_id: str, content: str) -> int:
     """
     Add a user message to a conversation.
 
     Args:
         conversation_id: Conversation identifier
         content: User message content
+
+    Returns:
+        Number of messages stored before this one (0 means first message)
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute(
-        "INSERT INTO messages (conversation_id, role, content, created_at) VALUES (?, ?, ?, ?)",
-        (conversation_id, "user", content, datetime.utcnow().isoformat())
-    )
-    conn.commit()
-    conn.close()
+    # --- CHANGED --- Count and insert in one transaction so callers learn
+    # is_first_message from the insert itself instead of a separate query.
+    # (A RETURNING subquery would be tidier, but SQLite forbids subqueries in
+    # RETURNING clauses.)
+    with _WRITE_LOCK:
+        c = conn.cursor()
+        # --- CHANGED --- IMMEDIATE takes the write lock up front so the
+        # transaction cannot hit SQLITE_BUSY when upgrading from the read
+        c.execute("BEGIN IMMEDIATE")
+        # --- CHANGED --- Roll back on any failure: the connection is shared,
+        # and a transaction left open would wedge every subsequent write
+        try:
+            # --- CHANGED --- The denormalized counter doubles as the prior count
+            c.execute("SELECT message_count FROM conversations WHERE id = ?", (conversation_id,))
+            row = c.fetchone()
+            prior_count = row[0] if row else 0
+            if _DB_HAS_TS_DEFAULT:
+                c.execute(_SQL_INSERT_MESSAGE_NOTS, (conversation_id, "user", content))
+            else:
+                c.execute(
+                    _SQL_INSERT_MESSAGE,
+                    (conversation_id, "user", content, datetime.utcnow().isoformat())
+                )
+            c.execute(_SQL_BUMP_MESSAGE_COUNT, (conversation_id,))
+            c.execute("COMMIT")
+        except BaseException:
+            c.execute("ROLLBACK")
+            raise
+    return prior_count
 
 
 def add_assistant_message(
     conversation_id: str,
-    stage1: List[Dict[str, Any]],
-    stage2: List[Dict[str, Any]],
+    stage1: List[Stage1Result],
+    stage2: List[Stage2Result],
     stage3: Dict[str, Any]
 ):
     """
@@ -292,79 +469,80 @@ def add_assistant_message(
         stage3: Final synthesized response
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    created_at = datetime.utcnow().isoformat()
-
-    c.execute(
-        "INSERT INTO messages (conversation_id, role, content, created_at) VALUES (?, ?, ?, ?)",
-        (conversation_id, "assistant", "", created_at)
-    )
-    msg_id = c.lastrowid
 
-    label_to_model = {f"Response {chr(65+i)}": r["model"] for i, r in enumerate(stage1)}
-
-    for r in stage1:
-        c.execute(
-            "INSERT INTO model_responses (message_id, model, stage, response) VALUES (?, ?, ?, ?)",
-            (msg_id, r["model"], 1, r["response"])
-        )
-
-    for r in stage2:
-        evaluator_model = r["model"]
-        c.execute(
-            "INSERT INTO model_responses (message_id, model, stage, response) VALUES (?, ?, ?, ?)",
-            (msg_id, evaluator_model, 2, r["ranking"])
-        )
-
-        parsed_ranking = r.get("parsed_ranking", [])
-        rubric = r.get("rubric", [])
-
-        if rubric:
-            for ev in rubric:
-                label_short = ev.get('response_label', '')
-                label = f"Response {label_short}"
-                subject_model = label_to_model.get(label, f"unknown_{label_short}")
-                
-                try:
-                    rank_pos = parsed_ranking.index(label) + 1
-                except ValueError:
-                    rank_pos = 99
-
-                c.execute('''
-                    INSERT INTO rankings (
-                        message_id, evaluator_model, subject_model, rank_position,
-                        accuracy_score, reasoning_score, completeness_score, clarity_score, confidence
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    msg_id, 
-                    evaluator_model, 
-                    subject_model, 
-                    rank_pos,
-                    ev.get("accuracy"), 
-                    ev.get("reasoning"), 
-                    ev.get("completeness"),
-                    ev.get("clarity"), 
-                    ev.get("confidence")
-                ))
-        else:
-            for i, label in enumerate(parsed_ranking):
-                subject_model = label_to_model.get(label, f"unknown_{label}")
-                c.execute('''
-                    INSERT INTO rankings (
-                        message_id, evaluator_model, subject_model, rank_position
-                    ) VALUES (?, ?, ?, ?)
-                ''', (
-                    msg_id, evaluator_model, subject_model, i + 1
-                ))
-
-    if stage3:
-        c.execute(
-            "INSERT INTO model_responses (message_id, model, stage, response) VALUES (?, ?, ?, ?)",
-            (msg_id, stage3.get("model", ""), 3, stage3.get("response", ""))
-        )
-
-    conn.commit()
-    conn.close()
+    label_to_model = {_LABELS[i]: r.model for i, r in enumerate(stage1)}
+
+    with _WRITE_LOCK:
+        c = conn.cursor()
+        # --- CHANGED --- One explicit transaction with batched executemany
+        # inserts: each statement shape is prepared once and the commit pays
+        # a single fsync for the whole message
+        c.execute("BEGIN IMMEDIATE")
+        # --- CHANGED --- Roll back on any failure: the connection is shared,
+        # and a transaction left open would wedge every subsequent write
+        try:
+            if _DB_HAS_TS_DEFAULT:
+                c.execute(_SQL_INSERT_MESSAGE_NOTS, (conversation_id, "assistant", ""))
+            else:
+                c.execute(
+                    _SQL_INSERT_MESSAGE,
+                    (conversation_id, "assistant", "", datetime.utcnow().isoformat())
+                )
+            msg_id = c.lastrowid
+
+            response_rows = [(msg_id, r.model, 1, r.response) for r in stage1]
+            response_rows += [(msg_id, r.model, 2, r.ranking) for r in stage2]
+            if stage3:
+                response_rows.append((msg_id, stage3.get("model", ""), 3, stage3.get("response", "")))
+            c.executemany(_SQL_INSERT_MR, response_rows)
+
+            # --- CHANGED --- One statement shape for every ranking row: the
+            # no-rubric branch pads the score columns with None, so a single
+            # executemany covers both cases with one prepared statement
+            rank_rows = []
+            for r in stage2:
+                parsed_ranking = r.parsed_ranking or []
+                rubric = r.rubric or []
+
+                if rubric:
+                    # --- CHANGED --- O(1) rank lookups instead of a linear
+                    # .index() scan (and its ValueError branch) per rubric entry
+                    rank_lookup = {lbl: i + 1 for i, lbl in enumerate(parsed_ranking)}
+                    for ev in rubric:
+                        # --- CHANGED --- Models occasionally emit the label as
+                        # a bare number; coerce before the len/ord fast path so
+                        # a malformed rubric can't raise TypeError
+                        label_short = str(ev.get('response_label', ''))
+                        idx = ord(label_short) - 65 if len(label_short) == 1 else -1
+                        label = _LABELS[idx] if 0 <= idx < 26 else f"Response {label_short}"
+                        subject_model = label_to_model.get(label, f"unknown_{label_short}")
+                        rank_pos = rank_lookup.get(label, 99)
+
+                        rank_rows.append((
+                            msg_id,
+                            r.model,
+                            subject_model,
+                            rank_pos,
+                            ev.get("accuracy"),
+                            ev.get("reasoning"),
+                            ev.get("completeness"),
+                            ev.get("clarity"),
+                            ev.get("confidence")
+                        ))
+                else:
+                    for i, label in enumerate(parsed_ranking):
+                        subject_model = label_to_model.get(label, f"unknown_{label}")
+                        rank_rows.append((msg_id, r.model, subject_model, i + 1,
+                                          None, None, None, None, None))
+
+            if rank_rows:
+                c.executemany(_SQL_INSERT_RANK_FULL, rank_rows)
+
+            c.execute(_SQL_BUMP_MESSAGE_COUNT, (conversation_id,))
+            c.execute("COMMIT")
+        except BaseException:
+            c.execute("ROLLBACK")
+            raise
 
 
 def update_conversation_title(conversation_id: str, title: str):
@@ -376,10 +554,20 @@ def update_conversation_title(conversation_id: str, title: str):
         title: New title for the conversation
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("UPDATE conversations SET title = ? WHERE id = ?", (title, conversation_id))
-    conn.commit()
-    conn.close()
+    with _WRITE_LOCK:
+        conn.execute("UPDATE conversations SET title = ? WHERE id = ?", (title, conversation_id))
+
+
+# --- CHANGED --- 10 ** (d / 400) tabulated for integer rating differences in
+# [-2000, 2000]; the pair loop indexes this instead of exponentiating. Ratings
+# are rounded to whole Elo points for the lookup, well below presentation
+# precision (results are rounded to integers anyway).
+_POW10 = np.power(10.0, np.arange(-2000, 2001) / 400.0)
+
+# --- CHANGED --- Both tables are append-only, so their max rowids identify
+# the data the ratings were computed from; the analytics endpoint only pays
+# for a recomputation when a new assistant message has landed
+_ELO_CACHE = {"key": None, "result": None}
 
 
 def calculate_elo_ratings() -> List[Dict[str, Any]]:
@@ -390,79 +578,105 @@ def calculate_elo_ratings() -> List[Dict[str, Any]]:
     """
     conn = get_db_connection()
     c = conn.cursor()
-    # Get all rankings that have a valid rank_position
+    # --- CHANGED --- Plain tuples for these aggregate reads: sqlite3.Row
+    # costs a keyed lookup per column access, and this path touches every row
+    # in the tables
+    c.row_factory = None
+
     c.execute('''
-        SELECT message_id, evaluator_model, subject_model, rank_position 
-        FROM rankings 
-        WHERE rank_position != 99
-        ORDER BY message_id, evaluator_model, rank_position ASC
+        SELECT (SELECT COALESCE(MAX(id), 0) FROM rankings),
+               (SELECT COALESCE(MAX(id), 0) FROM model_responses)
     ''')
-    ranking_rows = c.fetchall()
-    
-    # Also get all stage1 responses to count appearances accurately
-    c.execute('SELECT message_id, model FROM model_responses WHERE stage = 1')
-    stage1_rows = c.fetchall()
-    conn.close()
-
-    from collections import defaultdict
-    elo = defaultdict(lambda: 1000.0)
-    wins = defaultdict(int)
-    losses = defaultdict(int)
-    
+    cache_key = c.fetchone()
+    if cache_key == _ELO_CACHE["key"]:
+        return _ELO_CACHE["result"]
+
     # Count appearances (how many times a model gave a Stage 1 response)
-    appearances = defaultdict(int)
-    for r in stage1_rows:
-        appearances[r["model"]] += 1
-        # ensure they are at least initialized in the elo dict even if they have 0 wins/losses
-        _ = elo[r["model"]]
+    # --- CHANGED --- Aggregated in SQL over the (stage, model) index rather
+    # than fetching every stage-1 row back to Python
+    c.execute('SELECT model, COUNT(*) FROM model_responses WHERE stage = 1 GROUP BY model')
+    appearance_counts = dict(c.fetchall())
+
+    # Models that only ever appear as ranking subjects still need an id
+    c.execute('SELECT DISTINCT subject_model FROM rankings WHERE rank_position != 99')
+    subject_models = [row[0] for row in c.fetchall()]
+
+    # --- CHANGED --- Let SQLite enumerate the (winner, loser) pairs with a
+    # self-join over each (message, evaluator) group instead of nesting Python
+    # loops; a.rank_position < b.rank_position makes row a the winner and
+    # drops draws, and the covering index keeps the join index-only.
+    # The pairs stream straight off the cursor in arraysize batches rather
+    # than being materialized with fetchall.
+    pair_cursor = conn.cursor()
+    pair_cursor.row_factory = None
+    pair_cursor.arraysize = 10000
+    pair_cursor.execute('''
+        WITH pairs AS (
+            SELECT a.message_id AS message_id,
+                   a.evaluator_model AS evaluator_model,
+                   a.subject_model AS winner,
+                   b.subject_model AS loser
+            FROM rankings a
+            JOIN rankings b
+              ON a.message_id = b.message_id
+             AND a.evaluator_model = b.evaluator_model
+             AND a.rank_position < b.rank_position
+            WHERE a.rank_position != 99 AND b.rank_position != 99
+        )
+        SELECT message_id, evaluator_model, winner, loser
+        FROM pairs
+        ORDER BY message_id, evaluator_model
+    ''')
 
-    # Group rankings by message_id and evaluator_model
-    groups = defaultdict(list)
-    for r in ranking_rows:
-        groups[(r["message_id"], r["evaluator_model"])].append(r)
+    # --- CHANGED --- Structure-of-arrays layout: map every model to a dense
+    # integer id once, then keep elo/wins/losses/appearances in contiguous
+    # NumPy arrays indexed by that id instead of hashing model strings on
+    # every update
+    model_list = sorted(appearance_counts)
+    model_list += sorted(m for m in subject_models if m not in appearance_counts)
+    model_idx = {m: i for i, m in enumerate(model_list)}
+
+    elo = np.full(len(model_list), 1000.0)
+    wins = np.zeros(len(model_list), dtype=np.int32)
+    losses = np.zeros(len(model_list), dtype=np.int32)
+    appearances = np.zeros(len(model_list), dtype=np.int32)
+    for model, count in appearance_counts.items():
+        appearances[model_idx[model]] = count
 
     K = 32.0
 
-    for (msg_id, eval_model), ranks in groups.items():
-        # ranks is already sorted by rank_position
-        n = len(ranks)
-        for i in range(n):
-            for j in range(i + 1, n):
-                model_a = ranks[i]["subject_model"]
-                model_b = ranks[j]["subject_model"]
-                rank_a = ranks[i]["rank_position"]
-                rank_b = ranks[j]["rank_position"]
-                
-                # if rank_position is the same, skip (draw)
-                if rank_a == rank_b:
-                    continue
-                    
-                # a is sorted before b, so rank_a < rank_b (a wins)
-                winner = model_a if rank_a < rank_b else model_b
-                loser = model_b if rank_a < rank_b else model_a
-
-                rating_w = elo[winner]
-                rating_l = elo[loser]
-
-                expected_w = 1.0 / (1.0 + 10.0 ** ((rating_l - rating_w) / 400.0))
-                expected_l = 1.0 / (1.0 + 10.0 ** ((rating_w - rating_l) / 400.0))
-
-                elo[winner] = rating_w + K * (1.0 - expected_w)
-                elo[loser] = rating_l + K * (0.0 - expected_l)
-
-                wins[winner] += 1
-                losses[loser] += 1
+    # --- CHANGED --- Pairs arrive grouped by (message, evaluator); batch each
+    # group's Elo math in NumPy and apply the summed deltas once per group.
+    # Elo is zero-sum per pair: the loser's delta is minus the winner's.
+    for _, pair_iter in groupby(pair_cursor, key=lambda r: (r[0], r[1])):
+        pairs = list(pair_iter)
+        winner_idx = np.fromiter((model_idx[p[2]] for p in pairs), dtype=np.int32, count=len(pairs))
+        loser_idx = np.fromiter((model_idx[p[3]] for p in pairs), dtype=np.int32, count=len(pairs))
+
+        # expected_l would be 1 - expected_w, so only the winner's expected
+        # score is ever computed; the exponent comes from the lookup table
+        diff = np.clip(np.rint(elo[loser_idx] - elo[winner_idx]), -2000, 2000).astype(np.intp)
+        expected_w = 1.0 / (1.0 + _POW10[diff + 2000])
+        deltas = K * (1.0 - expected_w)
+
+        np.add.at(elo, winner_idx, deltas)
+        np.add.at(elo, loser_idx, -deltas)
+        np.add.at(wins, winner_idx, 1)
+        np.add.at(losses, loser_idx, 1)
 
     results = []
-    for model, rating in elo.items():
+    for model, i in model_idx.items():
         results.append({
             "model": model,
-            "elo": round(rating),
-            "wins": wins[model],
-            "losses": losses[model],
-            "appearances": appearances[model]
+            "elo": round(float(elo[i])),
+            "wins": int(wins[i]),
+            "losses": int(losses[i]),
+            "appearances": int(appearances[i])
         })
 
     # Sort descending by elo
     results.sort(key=lambda x: x["elo"], reverse=True)
+
+    _ELO_CACHE["key"] = cache_key
+    _ELO_CACHE["result"] = results
     return results
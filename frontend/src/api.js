@@ -149,6 +149,15 @@ export const api = {
       for (const line of lines) {
         if (line.startsWith('data: ')) {
           const data = line.slice(6);
+          // --- CHANGED --- Raw token frame: 'T' marker carries a Stage 3
+          // token without a JSON envelope (backslash/newline escaped)
+          if (data.startsWith('T')) {
+            const token = data
+              .slice(1)
+              .replace(/\\(\\|n)/g, (m, c) => (c === 'n' ? '\n' : '\\'));
+            onEvent('stage3_token', { type: 'stage3_token', data: token });
+            continue;
+          }
           try {
             const event = JSON.parse(data);
             onEvent(event.type, event);
@@ -1,7 +1,13 @@
+import asyncio
+import json
+import time
+
 import pytest
 import httpx
 from httpx import Response
+from backend import council
 from backend.council import (
+    Stage2Result,
     parse_ranking_from_text,
     calculate_aggregate_rankings,
     stage1_collect_responses,
@@ -54,12 +60,12 @@ def test_aggregate_rankings_self_score_discounted():
     confirm that model's self-score is weighted at 0.5
     """
     stage2_results = [
-        {
-            "model": "model_1",
-            "ranking": "FINAL RANKING:\n1. Response A\n2. Response B",
-            "parsed_ranking": ["Response A", "Response B"],
-            "rubric": None
-        }
+        Stage2Result(
+            model="model_1",
+            ranking="FINAL RANKING:\n1. Response A\n2. Response B",
+            parsed_ranking=["Response A", "Response B"],
+            rubric=None
+        )
     ]
     label_to_model = {
         "Response A": "model_1",
@@ -101,8 +107,8 @@ async def test_stage1_partial_failure(mock_openrouter):
     results = await stage1_collect_responses("Hello", council_models=models)
     
     assert len(results) == 1
-    assert results[0]["model"] == "model_success"
-    assert results[0]["response"] == "Success content"
+    assert results[0].model == "model_success"
+    assert results[0].response == "Success content"
 
 @pytest.mark.asyncio
 async def test_run_full_council_minimum_guard(mock_openrouter):
@@ -121,3 +127,47 @@ async def test_run_full_council_minimum_guard(mock_openrouter):
     assert len(s2) == 0
     assert s3["model"] == "error"
     assert "At least two models are required" in s3["response"]
+
+@pytest.mark.asyncio
+async def test_stage1_with_routing_reuses_overlap(mock_openrouter, monkeypatch):
+    """
+    (7) route to a preset that shares one model with the default council,
+    confirm the overlapping speculative response is reused, only the missing
+    model is queried again, and the delta round runs concurrently with the
+    speculative round rather than after it
+    """
+    overlap_model = council.COUNCIL_MODELS[0]
+    preset = (overlap_model, "custom/extra-model")
+    monkeypatch.setitem(council.COUNCIL_PRESETS, "CODING", preset)
+
+    delay = 0.3
+    queried_models = []
+
+    async def side_effect(request):
+        model = json.loads(request.read().decode("utf-8"))["model"]
+        queried_models.append(model)
+        await asyncio.sleep(delay)
+        return Response(200, json={
+            "id": "gen-123",
+            "choices": [{"message": {"content": f"resp-{model}"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 20}
+        })
+
+    mock_openrouter.post("/api/v1/chat/completions").mock(side_effect=side_effect)
+
+    category_task = asyncio.create_task(asyncio.sleep(0, result="CODING"))
+    start = time.monotonic()
+    results, resolved, category = await council.stage1_with_routing(
+        "Hello", None, category_task
+    )
+    elapsed = time.monotonic() - start
+
+    assert category == "CODING"
+    assert resolved == preset
+    assert [r.model for r in results] == [overlap_model, "custom/extra-model"]
+    # The overlapping model was only hit once, by the speculative round
+    assert queried_models.count(overlap_model) == 1
+    assert queried_models.count("custom/extra-model") == 1
+    # Every model sleeps `delay`; if the delta round waited for the
+    # speculative round to finish, elapsed would be at least 2 * delay
+    assert elapsed < 1.5 * delay
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import pytest
+from httpx import Response
+
+from backend import openrouter
+from backend.openrouter import _KeyPool, query_models_quorum
+
+
+@pytest.mark.asyncio
+async def test_quorum_drops_straggler(mock_openrouter):
+    """
+    (1) mock two fast models and one that hangs past the grace period,
+    confirm the quorum gather returns the fast responses and maps the
+    straggler to None instead of waiting for it
+    """
+    models = ["model_fast_1", "model_fast_2", "model_slow"]
+
+    async def side_effect(request):
+        body = request.read().decode("utf-8")
+        if "model_slow" in body:
+            await asyncio.sleep(3)
+        return Response(200, json={
+            "id": "gen-123",
+            "choices": [{"message": {"content": "fast content"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 20}
+        })
+
+    mock_openrouter.post("/api/v1/chat/completions").mock(side_effect=side_effect)
+
+    results = await query_models_quorum(
+        models,
+        [{"role": "user", "content": "Hello"}],
+        grace_factor=0.1,
+        min_grace=0.2
+    )
+
+    assert results["model_fast_1"]["content"] == "fast content"
+    assert results["model_fast_2"]["content"] == "fast content"
+    assert results["model_slow"] is None
+
+
+@pytest.mark.asyncio
+async def test_key_pool_skips_rate_limited_key():
+    """
+    (2) rotate a two-key pool, rate-limit one key, confirm acquire skips it
+    until report_success clears the ban
+    """
+    pool = _KeyPool(["key_1", "key_2"])
+
+    assert await pool.acquire() == "key_1"
+    assert await pool.acquire() == "key_2"
+
+    await pool.report_rate_limited("key_1")
+    assert await pool.acquire() == "key_2"
+    assert await pool.acquire() == "key_2"
+
+    await pool.report_success("key_1")
+    assert await pool.acquire() == "key_1"
+
+
+@pytest.mark.asyncio
+async def test_429_response_bans_key(mock_openrouter, monkeypatch):
+    """
+    (3) mock a 429 response, confirm the key used for the request is banned
+    in the pool and the call returns None
+    """
+    pool = _KeyPool(["key_1", "key_2"])
+    monkeypatch.setattr(openrouter, "_key_pool", pool)
+
+    mock_openrouter.post("/api/v1/chat/completions").mock(
+        return_value=Response(429, json={"error": "rate limited"})
+    )
+
+    result = await openrouter.query_model("model_1", [{"role": "user", "content": "Hello"}])
+
+    assert result is None
+    assert "key_1" in pool._banned_until
+    assert "key_2" not in pool._banned_until
@@ -0,0 +1,71 @@
+import sqlite3
+import uuid
+
+import pytest
+
+from backend import storage
+from backend.council import Stage1Result, Stage2Result
+
+
+def test_failed_write_rolls_back_cleanly():
+    """
+    (1) force add_assistant_message to fail mid-transaction with an
+    unbindable value, confirm the transaction is rolled back and the shared
+    connection stays usable for subsequent writes
+    """
+    conversation_id = str(uuid.uuid4())
+    storage.create_conversation(conversation_id)
+
+    stage1 = [Stage1Result(model="model_1", response="resp-1")]
+    # object() cannot be bound as a SQLite parameter, so the stage-3 insert
+    # blows up after BEGIN IMMEDIATE has already opened the transaction
+    bad_stage3 = {"model": "chairman", "response": object()}
+
+    with pytest.raises(sqlite3.Error):
+        storage.add_assistant_message(conversation_id, stage1, [], bad_stage3)
+
+    # The failed write must not leave the transaction open: a follow-up
+    # write on the same connection succeeds and sees no leaked rows
+    assert storage.add_user_message(conversation_id, "still works") == 0
+    convo = storage.get_conversation(conversation_id)
+    assert [m["role"] for m in convo["messages"]] == ["user"]
+
+
+def test_malformed_rubric_label_does_not_crash():
+    """
+    (2) persist a stage-2 rubric whose response_label is an integer instead
+    of a letter, confirm add_assistant_message stores the message instead of
+    raising TypeError and the rubric scores survive the round trip
+    """
+    conversation_id = str(uuid.uuid4())
+    storage.create_conversation(conversation_id)
+    storage.add_user_message(conversation_id, "question")
+
+    stage1 = [
+        Stage1Result(model="model_1", response="resp-1"),
+        Stage1Result(model="model_2", response="resp-2"),
+    ]
+    stage2 = [
+        Stage2Result(
+            model="model_1",
+            ranking="FINAL RANKING:\n1. Response A",
+            parsed_ranking=["Response A"],
+            rubric=[{
+                "response_label": 1,
+                "accuracy": 7,
+                "reasoning": 6,
+                "completeness": 5,
+                "clarity": 8,
+                "confidence": 4,
+            }]
+        )
+    ]
+    stage3 = {"model": "chairman", "response": "final"}
+
+    storage.add_assistant_message(conversation_id, stage1, stage2, stage3)
+
+    convo = storage.get_conversation(conversation_id)
+    assistant = convo["messages"][1]
+    rubric = assistant["stage2"][0]["rubric"]
+    assert len(rubric) == 1
+    assert rubric[0]["accuracy"] == 7